@@ -1,8 +1,220 @@
-import matplotlib.pyplot as plt
+import copy
+import functools
+import logging
 import numpy as np
 import os
 from typing import Union, List, Dict, Optional, Tuple
 
+import easyFig_kernels as _kernels
+
+
+# What `from easyFig import *` has always provided; plt is resolved lazily
+# through __getattr__, so it still costs nothing until first used
+__all__ = ['plot_line', 'plot_bar', 'main', 'plt', 'np', 'os',
+           'Union', 'List', 'Dict', 'Optional', 'Tuple']
+
+logger = logging.getLogger(__name__)
+
+# pyplot is imported on first use, see _lazy_plt
+_plt = None
+
+# Longer np.arange(n) index arrays are built fresh rather than cached
+_ARANGE_CACHE_MAX_LEN = 100_000
+
+# Last style applied through _use_style and the rcParams it produced, so
+# repeated calls can skip it while nothing else has changed rcParams
+_LAST_STYLE = [None, None]
+
+# From this many bars on, plot_bar draws PolyCollections instead of Rectangles
+_COLLECTION_MIN_BARS = 1000
+
+
+def _lazy_plt():
+    # Importing matplotlib costs ~300ms, so defer it until the first plot
+    global _plt
+    if _plt is None:
+        import matplotlib.pyplot as plt
+        _plt = plt
+    return _plt
+
+
+def __getattr__(name):
+    # Keep easyFig.plt available without importing pyplot up front
+    if name == 'plt':
+        return _lazy_plt()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=32)
+def _cached_arange(n):
+    # Shared between plots, so make sure nobody writes into it
+    x = np.arange(n)
+    x.flags.writeable = False
+    return x
+
+
+def _arange(n):
+    if n > _ARANGE_CACHE_MAX_LEN:
+        return np.arange(n)
+    return _cached_arange(n)
+
+
+def _unmask(y):
+    # Masked points become NaN, which matplotlib leaves out as it does masks;
+    # np.asarray/np.ascontiguousarray would silently drop the mask
+    if isinstance(y, np.ma.MaskedArray):
+        return np.ma.filled(y.astype(np.float64), np.nan)
+    return y
+
+
+def _normalize_dict(data, x_data):
+    # Multiple data series: {"series1": [1,2,3], "series2": [2,3,4]}
+    return x_data, list(data.values()), list(data.keys())
+
+
+def _normalize_sequence(data, x_data):
+    if len(data) == 2 and isinstance(data[1], dict):
+        # Format: (x_data, {"series1": y1, "series2": y2})
+        x_vals, y_dict = data
+        return x_vals, list(y_dict.values()), list(y_dict.keys())
+
+    if len(data) == 2:
+        # Format: (x_data, y_data) single data series
+        x_vals, y_vals = data
+        return _normalize_series(y_vals, x_vals)
+
+    if all(isinstance(item, (list, tuple, np.ndarray)) for item in data):
+        # Multiple data series as list of lists (or of 1-D arrays)
+        return x_data, data, [f'Series {i+1}' for i in range(len(data))]
+
+    return _normalize_series(data, x_data)
+
+
+def _normalize_series(data, x_data):
+    # Single data series: [1, 2, 3, 4]
+    # np.asarray + newaxis is a view for float64 arrays, wrapping in a list would copy
+    y = np.asarray(_unmask(data))
+    if y.ndim == 2:
+        # 2-D array: one series per column, as ax.plot treats it
+        return x_data, y.T, None
+    return x_data, y[np.newaxis], None
+
+
+_NORMALIZERS = {
+    dict: _normalize_dict,
+    list: _normalize_sequence,
+    tuple: _normalize_sequence,
+}
+
+
+def _normalize(data, x_data=None):
+    """
+    Convert any supported data format into a common layout
+
+    Returns:
+    --------
+    (x_vals, Y, names)
+        x_vals : X-axis values as given (ndarrays made C-contiguous, lists left
+            as-is so tick labels keep their original text),
+            np.arange(n_points) if not provided
+        Y : C-contiguous float64 matrix of shape (n_series, n_points), or a
+            list of 1-D arrays (one per series) when the series are ragged or
+            not numeric, e.g. categorical y values; x_vals is then left as
+            given, possibly None
+        names : series names, or None for a single unnamed series
+
+    For the matrix layout Y (and x_vals when it is an ndarray) is
+    C-contiguous, so matplotlib and the easyFig_kernels Numba kernels can use
+    it without making another copy.
+    """
+    normalizer = _NORMALIZERS.get(type(data))
+    if normalizer is None:
+        # Subclasses (OrderedDict, ...) fall back to isinstance checks
+        if isinstance(data, dict):
+            normalizer = _normalize_dict
+        elif isinstance(data, (list, tuple)):
+            normalizer = _normalize_sequence
+        else:
+            normalizer = _normalize_series
+
+    x_vals, series, names = normalizer(data, x_data)
+    if isinstance(series, list):
+        series = [_unmask(y) for y in series]
+    try:
+        Y = np.ascontiguousarray(series, dtype=np.float64)
+    except (ValueError, TypeError):
+        # Ragged or non-numeric series cannot form a float matrix
+        return x_vals, [np.asarray(y) for y in series], names
+    if Y.ndim == 1:
+        # No series ({}) or scalar series ({'a': 1}): one row per series
+        Y = Y.reshape(len(Y), 1 if len(Y) else 0)
+    # Shared implicit index instead of one np.arange per series in ax.plot
+    if x_vals is None:
+        x_vals = _arange(Y.shape[1])
+    elif isinstance(x_vals, np.ndarray):
+        x_vals = np.ascontiguousarray(x_vals)
+    assert Y.flags['C_CONTIGUOUS']
+    return x_vals, Y, names
+
+
+def _acquire(figsize, headless=False):
+    if not headless:
+        return _lazy_plt().subplots(figsize=figsize)
+
+    # Save-only figures bypass pyplot: no GUI canvas or figure manager, and
+    # nothing keeps them alive once the caller drops them
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig, fig.subplots()
+
+
+def _fits_collection(kwargs) -> bool:
+    # Only switch to collections when every kwarg is understood by them
+    from matplotlib.collections import PolyCollection
+    return all(hasattr(PolyCollection, 'set_' + key) for key in kwargs)
+
+
+def _draw_bar_collections(ax, centers, Y, bar_width, bottoms, labels, kwargs):
+    # One PolyCollection per series instead of one Rectangle per bar
+    from matplotlib.collections import PolyCollection
+    kwargs = dict(kwargs)
+    facecolor = kwargs.pop('facecolor', kwargs.pop('color', None))
+
+    left = centers - bar_width / 2
+    right = left + bar_width
+    top = bottoms + Y
+    xs = np.stack([left, left, right, right], axis=-1)
+    ys = np.stack([bottoms, top, top, bottoms], axis=-1)
+    verts = np.stack([xs, ys], axis=-1)  # (n_series, n_points, 4, 2)
+
+    for i in range(Y.shape[0]):
+        coll = PolyCollection(verts[i], label=labels[i],
+                              facecolor=f'C{i}' if facecolor is None else facecolor,
+                              **kwargs)
+        coll.sticky_edges.y.append(bottoms[i].min())
+        ax.add_collection(coll)
+    ax.autoscale_view()
+
+
+def _str_labels(x) -> List[str]:
+    # Format tick labels once up front rather than per tick at draw time;
+    # str() per value keeps mixed input like [1, 2.5, 3] as '1', '2.5', '3'
+    return [str(v) for v in x]
+
+
+def _use_style(style):
+    # plt.style.use re-reads the style and rebuilds rcParams on every call.
+    # Comparing against a snapshot is cheaper and still resets any rcParams
+    # changed by the user, rc_context or another style.use call; the snapshot
+    # is deep-copied so in-place edits of list values are caught as well
+    plt = _lazy_plt()
+    if _LAST_STYLE[0] == style and plt.rcParams == _LAST_STYLE[1]:
+        return
+    plt.style.use(style)
+    _LAST_STYLE[:] = [style, copy.deepcopy(dict(plt.rcParams))]
+
 
 def plot_line(data: Union[List, Dict, Tuple],
               x_data: Optional[Union[List, np.ndarray]] = None,
@@ -14,6 +226,9 @@ def plot_line(data: Union[List, Dict, Tuple],
               figsize: Tuple[int, int] = (10, 6),
               style: str = 'default',
               grid: bool = True,
+              show: bool = True,
+              dpi: int = 300,
+              bbox_inches: Optional[str] = 'tight',
               **kwargs):
     """
     Convenient function to create line plots
@@ -46,6 +261,7 @@ def plot_line(data: Union[List, Dict, Tuple],
 
     save_path : Optional[str]
         Save path, supports relative and absolute paths
+        (logged at INFO level on the "easyFig" logger once saved)
 
     figsize : Tuple[int, int]
         Figure size (width, height)
@@ -56,58 +272,44 @@ def plot_line(data: Union[List, Dict, Tuple],
     grid : bool
         Whether to display grid
 
+    show : bool
+        Whether to display the figure. If False and save_path is set, the
+        figure is drawn off-screen on an Agg canvas without pyplot, so it is
+        freed as soon as it is no longer referenced (useful for batch
+        plotting); otherwise it is closed to free its memory
+
+    dpi : int
+        Resolution of the saved image; rendering cost grows with dpi squared
+
+    bbox_inches : Optional[str]
+        Passed to savefig; 'tight' crops to the content at the cost of an
+        extra layout pass, None saves the full figure
+
     **kwargs : 
         Additional parameters passed to plt.plot()
     """
 
     # Set style
-    plt.style.use(style)
+    _use_style(style)
 
     # Create figure
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _acquire(figsize, headless=bool(save_path) and not show)
 
     # Process data format
-    if isinstance(data, dict):
-        # Multiple data series: {"series1": [1,2,3], "series2": [2,3,4]}
-        series_names = list(data.keys())
-
-        for i, (name, y_values) in enumerate(data.items()):
-            if x_data is not None:
-                ax.plot(x_data, y_values, label=name, **kwargs)
-            else:
-                ax.plot(y_values, label=name, **kwargs)
-
-    elif isinstance(data, (list, tuple)) and len(data) == 2 and isinstance(data[1], dict):
-        # Format: (x_data, {"series1": y1, "series2": y2})
-        x_vals, y_dict = data
-        series_names = list(y_dict.keys())
-
-        for name, y_values in y_dict.items():
-            ax.plot(x_vals, y_values, label=name, **kwargs)
-
-    elif isinstance(data, (list, tuple)) and len(data) == 2 and not isinstance(data[1], dict):
-        # Format: (x_data, y_data) single data series
-        x_vals, y_vals = data
-        ax.plot(x_vals, y_vals, **kwargs)
-        series_names = None
-        
-    elif isinstance(data, (list, tuple)) and all(isinstance(item, (list, tuple)) for item in data):
-        if x_data is None:
-            x_data = list(range(len(data[0])))
-        
-        for i, y_values in enumerate(data):
-            plt.plot(x_data, y_values, label=f'Series {i+1}')
-        
-        plt.legend()
-        series_names = None
-
+    x_vals, Y, series_names = _normalize(data, x_data)
+    want_legend = (legend is True or isinstance(legend, list)
+                   or (legend is None and series_names is not None))
+
+    if isinstance(Y, list):
+        # Ragged or non-numeric series are drawn one ax.plot call at a time
+        x_args = () if x_vals is None else (x_vals,)
+        lines = [ax.plot(*x_args, y, **kwargs)[0] for y in Y]
     else:
-        # Single data series: [1, 2, 3, 4]
-        if x_data is not None:
-            ax.plot(x_data, data, **kwargs)
-        else:
-            ax.plot(data, **kwargs)
-        series_names = None
+        # One call draws every series; colors cycle across the columns of Y.T
+        lines = ax.plot(x_vals, Y.T, **kwargs)
+    if want_legend and series_names is not None:
+        for line, name in zip(lines, series_names):
+            line.set_label(name)
 
     # Set labels and title
     ax.set_xlabel(xlabel)
@@ -115,32 +317,33 @@ def plot_line(data: Union[List, Dict, Tuple],
     ax.set_title(title)
 
     # Handle legend
-    if legend is True or (legend is None and series_names is not None):
+    if want_legend:
         if isinstance(legend, list):
             ax.legend(legend)
         else:
             ax.legend()
-    elif isinstance(legend, list):
-        ax.legend(legend)
 
     # Grid
     if grid:
         ax.grid(True, alpha=0.3)
 
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save image
     if save_path:
         # Ensure directory exists
         dir_path = os.path.dirname(save_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
 
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Image saved to: {save_path}")
+        fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
+        logger.info("Image saved to: %s", save_path)
 
-    plt.show()
+    if show:
+        _lazy_plt().show()
+    elif not save_path:
+        _lazy_plt().close(fig)
     return fig, ax
 
 def plot_bar(data: Union[List, Dict, Tuple],
@@ -155,6 +358,9 @@ def plot_bar(data: Union[List, Dict, Tuple],
              grid: bool = True,
              bar_type: str = 'grouped',  # 'grouped' or 'stacked'
              width: float = 0.8,
+             show: bool = True,
+             dpi: int = 300,
+             bbox_inches: Optional[str] = 'tight',
              **kwargs):
     """
     Convenient function to create bar plots
@@ -166,6 +372,7 @@ def plot_bar(data: Union[List, Dict, Tuple],
         - List: single data series [1, 2, 3, 4]
         - Dict: multiple data series {"series1": [1,2,3], "series2": [2,3,4]}
         - Tuple: (x_data, y_data) or (x_data, {"series1": y1, "series2": y2})
+        All series must be numeric and of the same length
 
     x_data : Optional[Union[List, np.ndarray]]
         X-axis labels/positions, if not provided, indices will be used
@@ -187,6 +394,7 @@ def plot_bar(data: Union[List, Dict, Tuple],
 
     save_path : Optional[str]
         Save path, supports relative and absolute paths
+        (logged at INFO level on the "easyFig" logger once saved)
 
     figsize : Tuple[int, int]
         Figure size (width, height)
@@ -203,110 +411,73 @@ def plot_bar(data: Union[List, Dict, Tuple],
     width : float
         Bar width (0.0 to 1.0)
 
+    show : bool
+        Whether to display the figure. If False and save_path is set, the
+        figure is drawn off-screen on an Agg canvas without pyplot, so it is
+        freed as soon as it is no longer referenced (useful for batch
+        plotting); otherwise it is closed to free its memory
+
+    dpi : int
+        Resolution of the saved image; rendering cost grows with dpi squared
+
+    bbox_inches : Optional[str]
+        Passed to savefig; 'tight' crops to the content at the cost of an
+        extra layout pass, None saves the full figure
+
     **kwargs : 
         Additional parameters passed to plt.bar()
+        Charts with 1000+ bars and no legend are drawn as one PolyCollection
+        per series instead, as long as every kwarg is also a collection property
     """
 
     # Set style
-    plt.style.use(style)
+    _use_style(style)
 
     # Create figure
-    fig, ax = plt.subplots(figsize=figsize)
+    fig, ax = _acquire(figsize, headless=bool(save_path) and not show)
 
     # Process data format
-    if isinstance(data, dict):
-        # Multiple data series: {"series1": [1,2,3], "series2": [2,3,4]}
-        series_names = list(data.keys())
-        series_data = list(data.values())
-        
-        if x_data is None:
-            x_data = list(range(len(series_data[0])))
-        
-        x_pos = np.arange(len(x_data))
-        
-        if bar_type == 'stacked':
-            # Stacked bar chart
-            bottom = np.zeros(len(x_data))
-            for i, (name, y_values) in enumerate(data.items()):
-                ax.bar(x_pos, y_values, width, label=name, bottom=bottom, **kwargs)
-                bottom += np.array(y_values)
-        else:
-            # Grouped bar chart
-            bar_width = width / len(series_names)
-            for i, (name, y_values) in enumerate(data.items()):
-                offset = (i - len(series_names)/2 + 0.5) * bar_width
-                ax.bar(x_pos + offset, y_values, bar_width, label=name, **kwargs)
-        
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(x_data)
-
-    elif isinstance(data, (list, tuple)) and len(data) == 2 and isinstance(data[1], dict):
-        # Format: (x_data, {"series1": y1, "series2": y2})
-        x_vals, y_dict = data
-        series_names = list(y_dict.keys())
-        
-        x_pos = np.arange(len(x_vals))
-        
-        if bar_type == 'stacked':
-            # Stacked bar chart
-            bottom = np.zeros(len(x_vals))
-            for name, y_values in y_dict.items():
-                ax.bar(x_pos, y_values, width, label=name, bottom=bottom, **kwargs)
-                bottom += np.array(y_values)
-        else:
-            # Grouped bar chart
-            bar_width = width / len(series_names)
-            for i, (name, y_values) in enumerate(y_dict.items()):
-                offset = (i - len(series_names)/2 + 0.5) * bar_width
-                ax.bar(x_pos + offset, y_values, bar_width, label=name, **kwargs)
-        
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(x_vals)
-
-    elif isinstance(data, (list, tuple)) and len(data) == 2 and not isinstance(data[1], dict):
-        # Format: (x_data, y_data) single data series
-        x_vals, y_vals = data
-        x_pos = np.arange(len(x_vals))
-        ax.bar(x_pos, y_vals, width, **kwargs)
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(x_vals)
-        series_names = None
-        
-    elif isinstance(data, (list, tuple)) and all(isinstance(item, (list, tuple)) for item in data):
-        # Multiple data series as list of lists
-        series_names = [f'Series {i+1}' for i in range(len(data))]
-        
-        if x_data is None:
-            x_data = list(range(len(data[0])))
-        
-        x_pos = np.arange(len(x_data))
-        
-        if bar_type == 'stacked':
-            # Stacked bar chart
-            bottom = np.zeros(len(x_data))
-            for i, y_values in enumerate(data):
-                ax.bar(x_pos, y_values, width, label=series_names[i], bottom=bottom, **kwargs)
-                bottom += np.array(y_values)
-        else:
-            # Grouped bar chart
-            bar_width = width / len(data)
-            for i, y_values in enumerate(data):
-                offset = (i - len(data)/2 + 0.5) * bar_width
-                ax.bar(x_pos + offset, y_values, bar_width, label=series_names[i], **kwargs)
-        
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(x_data)
+    x_vals, Y, series_names = _normalize(data, x_data)
+    if isinstance(Y, list):
+        raise ValueError("plot_bar needs numeric data series of equal length")
+    if len(x_vals) != Y.shape[1]:
+        raise ValueError(f"x_data has {len(x_vals)} values but the data series "
+                         f"have {Y.shape[1]}")
+    want_legend = (legend is True or isinstance(legend, list)
+                   or (legend is None and series_names is not None))
+    S = Y.shape[0]
+    if want_legend and series_names is not None:
+        labels = series_names
+    else:
+        # No legend needed: skip per-series labels, keep an explicit label=
+        labels = [kwargs.pop('label', None)] * S
+
+    x_pos = _arange(Y.shape[1])
 
+    if bar_type == 'stacked':
+        # Stacked bar chart
+        bar_width = width
+        centers = np.broadcast_to(x_pos, Y.shape)
+        bottoms = _kernels.stack_cumsum(Y)
     else:
-        # Single data series: [1, 2, 3, 4]
-        if x_data is None:
-            x_data = list(range(len(data)))
-        
-        x_pos = np.arange(len(x_data))
-        ax.bar(x_pos, data, width, **kwargs)
-        ax.set_xticks(x_pos)
-        ax.set_xticklabels(x_data)
-        series_names = None
+        # Grouped bar chart
+        bar_width = width / max(S, 1)
+        offsets = (np.arange(S, dtype=np.float64) - S/2 + 0.5) * bar_width
+        centers = x_pos.astype(np.float64)[None, :] + offsets[:, None]
+        bottoms = np.zeros_like(Y)
+    bottoms += kwargs.pop('bottom', 0)  # user-supplied baseline
+
+    # Collections are only faster without a legend: loc="best" scans every
+    # polygon vertex, which costs more than the Rectangles save
+    if not want_legend and Y.size >= _COLLECTION_MIN_BARS and _fits_collection(kwargs):
+        _draw_bar_collections(ax, centers, Y, bar_width, bottoms, labels, kwargs)
+    else:
+        for i in range(S):
+            ax.bar(centers[i], Y[i], bar_width, bottom=bottoms[i], label=labels[i], **kwargs)
+
+    ax.set_xticks(x_pos)
+    from matplotlib.ticker import FixedFormatter
+    ax.xaxis.set_major_formatter(FixedFormatter(_str_labels(x_vals)))
 
     # Set labels and title
     ax.set_xlabel(xlabel)
@@ -314,32 +485,33 @@ def plot_bar(data: Union[List, Dict, Tuple],
     ax.set_title(title)
 
     # Handle legend
-    if legend is True or (legend is None and series_names is not None):
+    if want_legend:
         if isinstance(legend, list):
             ax.legend(legend)
         else:
             ax.legend()
-    elif isinstance(legend, list):
-        ax.legend(legend)
 
     # Grid
     if grid:
         ax.grid(True, alpha=0.3, axis='y')  # Only show horizontal grid for bar charts
 
     # Adjust layout
-    plt.tight_layout()
+    fig.tight_layout()
 
     # Save image
     if save_path:
         # Ensure directory exists
         dir_path = os.path.dirname(save_path)
-        if dir_path and not os.path.exists(dir_path):
-            os.makedirs(dir_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
 
-        plt.savefig(save_path, dpi=300, bbox_inches='tight')
-        print(f"Image saved to: {save_path}")
+        fig.savefig(save_path, dpi=dpi, bbox_inches=bbox_inches)
+        logger.info("Image saved to: %s", save_path)
 
-    plt.show()
+    if show:
+        _lazy_plt().show()
+    elif not save_path:
+        _lazy_plt().close(fig)
     return fig, ax
 
 
@@ -0,0 +1,55 @@
+import importlib.util
+
+import numpy as np
+
+
+# numba is optional and slow to import, so only check that it is installed
+HAVE_NUMBA = importlib.util.find_spec('numba') is not None
+
+# Below this many values the JIT dispatch overhead outweighs the speedup
+NUMBA_MIN_SIZE = 50_000
+
+# Compiled kernel, built by _stack_cumsum_jit on first use
+_STACK_CUMSUM_JIT = [None]
+
+
+def _stack_cumsum_jit():
+    if _STACK_CUMSUM_JIT[0] is None:
+        from numba import njit, prange
+
+        @njit(parallel=True, cache=True)
+        def stack_cumsum_kernel(Y):
+            S, N = Y.shape
+            out = np.empty_like(Y)
+            for j in prange(N):
+                s = 0.0
+                for i in range(S):
+                    out[i, j] = s
+                    s += Y[i, j]
+            return out
+
+        _STACK_CUMSUM_JIT[0] = stack_cumsum_kernel
+    return _STACK_CUMSUM_JIT[0]
+
+
+def stack_cumsum(Y: np.ndarray) -> np.ndarray:
+    """
+    Compute the bottom of every bar in a stacked bar chart
+
+    Parameters:
+    -----------
+    Y : np.ndarray
+        C-contiguous float64 matrix of shape (n_series, n_points)
+
+    Returns:
+    --------
+    np.ndarray
+        Matrix of the same shape where row i is the sum of rows 0..i-1
+    """
+    if HAVE_NUMBA and Y.size > NUMBA_MIN_SIZE:
+        return _stack_cumsum_jit()(Y)
+
+    bottoms = np.empty_like(Y)
+    bottoms[:1] = 0
+    np.cumsum(Y[:-1], axis=0, out=bottoms[1:])
+    return bottoms